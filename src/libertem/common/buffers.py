@@ -42,11 +42,12 @@ def empty_aligned(size, dtype):
 
 
 def zeros_aligned(size, dtype):
-    if dtype == np.object or np.prod(size, dtype=np.int64) == 0:
+    if dtype == object or np.prod(size, dtype=np.int64) == 0:
         res = np.zeros(size, dtype=dtype)
     else:
+        # anonymous mappings are zero-filled by the OS; writing zeros would
+        # only fault in all pages up front, even those that are never used
         res = empty_aligned(size, dtype)
-        res[:] = 0
     return res
 
 
@@ -105,7 +106,7 @@ class BufferPool:
 
     @contextmanager
     def zeros(self, size, dtype):
-        if dtype == np.object or np.prod(size, dtype=np.int64) == 0:
+        if dtype == object or np.prod(size, dtype=np.int64) == 0:
             yield np.zeros(size, dtype=dtype)
         else:
             with self.empty(size, dtype) as res:
@@ -182,12 +183,15 @@ class BufferWrapper(object):
         self._shape = None
         self._ds_shape = None
         self._roi = None
+        # (partition slice, ROI-adjusted slice) of the last partition
+        self._roi_slice_cache = None
         self._contiguous_cache = dict()
 
     def set_roi(self, roi):
         if roi is not None:
             roi = roi.reshape((-1,))
         self._roi = roi
+        self._roi_slice_cache = None
 
     def set_shape_partition(self, partition, roi=None):
         self.set_roi(roi)
@@ -310,8 +314,18 @@ class BufferWrapper(object):
 
         Because _data is "compressed" if a ROI is set, we can't directly index and must
         calculate a new slice from the ROI.
+
+        The result is cached for the last partition, as it is requested once per
+        tile and counting the ROI entries is linear in the size of the dataset.
         """
-        return partition.slice.adjust_for_roi(self._roi)
+        partition_slice = partition.slice
+        if self._roi is None:
+            return partition_slice
+        cached = self._roi_slice_cache
+        if cached is None or cached[0] is not partition_slice:
+            cached = (partition_slice, partition_slice.adjust_for_roi(self._roi))
+            self._roi_slice_cache = cached
+        return cached[1]
 
     def get_view_for_dataset(self, dataset):
         if self._contiguous_cache:
@@ -358,6 +372,35 @@ class BufferWrapper(object):
         elif self._kind == "single":
             return self._data
 
+    def get_frame_views_for_tile(self, partition, tile):
+        """
+        get an array of frame views for all frames of a tile in a
+        partition- or dataset-sized :code:`kind="nav"` buffer. Indexing the
+        result with :code:`frame_idx` gives the same view as
+        :meth:`get_view_for_frame`, without repeating the slice calculation
+        for each frame.
+
+        .. versionadded:: 0.6.0
+        """
+        assert partition.shape.dims == partition.shape.sig.dims + 1
+        if self._contiguous_cache:
+            raise RuntimeError("Cache is not empty, has to be flushed")
+        if self._kind != "nav":
+            raise ValueError("frame views only supported for kind='nav', not %s" % self._kind)
+        partition_slice = self._slice_for_partition(partition)
+        tile_slice = tile.tile_slice
+        if self._data_coords_global:
+            offset = 0
+        else:
+            offset = partition_slice.origin[0]
+        result_start = tile_slice.origin[0] - offset
+        result_stop = result_start + tile_slice.shape[0]
+        # item shape: self._extra_shape, or (1,) if there is no extra shape
+        if len(self._extra_shape) > 0:
+            return self._data[result_start:result_stop]
+        else:
+            return self._data[result_start:result_stop, np.newaxis]
+
     def get_view_for_tile(self, partition, tile):
         """
         get a view for a single tile in a partition-sized buffer
@@ -467,12 +510,10 @@ class AuxBufferWrapper(BufferWrapper):
         by this method, that is, it should have global coordinates without
         having the ROI applied.
         """
-        # FIXME: right now creates a view for the partition slice, which
-        # AFAIK means we serialize the whole array; we could optimize here
-        # and only send over the partition slice. But maybe, later, when we
-        # actually properly scatter and share data, this becomes obsolete anyways,
-        # as we would scatter most likely for all partitions (to be flexible in node
-        # assignment, for example for availability)
+        # NOTE: only the partition slice of the data is serialized with the task.
+        # Later, when we actually properly scatter and share data, this may
+        # change, as we would scatter most likely for all partitions (to be
+        # flexible in node assignment, for example for availability)
         assert self._data_coords_global
         ps = partition.slice.get(nav_only=True)
         buf = self.__class__(self._kind, self._extra_shape, self._dtype)
@@ -480,7 +521,10 @@ class AuxBufferWrapper(BufferWrapper):
             roi_part = roi.reshape(-1)[ps]
             new_data = self._data[ps][roi_part]
         else:
-            new_data = self._data[ps]
+            # Only contiguous arrays can be passed out-of-band with pickle
+            # protocol 5 when the task is scattered; others are copied into
+            # the pickle stream. This is a no-op for contiguous views.
+            new_data = np.ascontiguousarray(self._data[ps])
         buf.set_buffer(new_data, is_global=False)
         buf.set_roi(roi)
         assert np.prod(new_data.shape) > 0
@@ -603,7 +603,7 @@ class Negotiator:
     def _get_udf_size_pref(self, udf):
         from libertem.udf import UDF
         udf_prefs = udf.get_tiling_preferences()
-        size = udf_prefs.get("total_size", np.float("inf"))
+        size = udf_prefs.get("total_size", float("inf"))
         if size is UDF.TILE_SIZE_BEST_FIT:
             size = self._get_default_size()
         return size
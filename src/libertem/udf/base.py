@@ -1,5 +1,6 @@
 from types import MappingProxyType
-from typing import Dict
+from typing import Any, Dict
+import concurrent.futures
 import logging
 import uuid
 
@@ -43,7 +44,10 @@ class UDFMeta:
             device_class = 'cpu'
         self._device_class = device_class
         if roi is not None:
-            roi = roi.reshape(dataset_shape.nav)
+            nav_shape = tuple(dataset_shape.nav)
+            # avoid creating a new array object if the ROI already has the nav shape
+            if roi.shape != nav_shape:
+                roi = roi.reshape(nav_shape)
         self._roi = roi
         self._slice = None
         if corrections is None:
@@ -78,12 +82,20 @@ class UDFMeta:
         return self._dataset_shape
 
     @property
-    def tiling_scheme(self) -> Shape:
+    def tiling_scheme(self) -> TilingScheme:
         """
         TilingScheme : the tiling scheme that was negotiated
         """
         return self._tiling_scheme
 
+    @tiling_scheme.setter
+    def tiling_scheme(self, tiling_scheme: TilingScheme):
+        if tiling_scheme is not None and not isinstance(tiling_scheme, TilingScheme):
+            raise TypeError(
+                "expected a TilingScheme, got %r" % type(tiling_scheme)
+            )
+        self._tiling_scheme = tiling_scheme
+
     @property
     def roi(self) -> np.ndarray:
         """
@@ -141,10 +153,26 @@ class UDFData:
     '''
     Container for result buffers, return value from running UDFs
     '''
+    # _current maps each key to its current view, or the raw data if no view
+    # is set, so that attribute access in the processing loop is a single lookup
+    __slots__ = ('_data', '_current', '_proxy', '_buffer_items', '_allocated', '_frame_views')
 
     def __init__(self, data: Dict[str, BufferWrapper]):
         self._data = data
-        self._views = {}
+        self._update_buffer_items()
+        # _current is only ever updated in place so that the proxy stays valid
+        self._current: Dict[str, Any] = {}
+        self._proxy = MappingProxyType(self._current)
+        self._frame_views = ()
+        self._update_current()
+
+    def __getstate__(self):
+        # views are transient, only the buffers are part of the state.
+        # Wrapped in a tuple since an empty dict would skip __setstate__
+        return (self._data,)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
 
     def __repr__(self) -> str:
         return "<UDFData: %r>" % (
@@ -152,12 +180,14 @@ class UDFData:
         )
 
     def __getattr__(self, k: str):
+        # slots that are not set yet, for example during unpickling, would
+        # otherwise recurse through self._current
         if k.startswith("_"):
             raise AttributeError("no such attribute: %s" % k)
         try:
-            return self._get_view_or_data(k)
-        except KeyError as e:
-            raise AttributeError(str(e))
+            return self._current[k]
+        except KeyError:
+            raise AttributeError("no such attribute: %s" % k)
 
     def get(self, k, default=None):
         try:
@@ -174,13 +204,21 @@ class UDFData:
             )
         super().__setattr__(k, v)
 
-    def _get_view_or_data(self, k):
-        if k in self._views:
-            return self._views[k]
-        res = self._data[k]
-        if hasattr(res, 'raw_data'):
-            return res.raw_data
-        return res
+    def _update_buffer_items(self):
+        # (key, buffer) pairs of all BufferWrapper-like values
+        self._buffer_items = tuple(
+            (k, buf) for k, buf in self._data.items()
+            if hasattr(buf, 'has_data')
+        )
+        # allocation state, updated by the allocate_* methods
+        self._allocated = {k: buf.has_data() for k, buf in self._buffer_items}
+
+    def _update_current(self):
+        # plain values are passed through, buffers are replaced by their raw data
+        current = self._current
+        current.update(self._data)
+        for k, buf in self._buffer_items:
+            current[k] = buf.raw_data
 
     def __getitem__(self, k):
         return self._data[k]
@@ -198,16 +236,21 @@ class UDFData:
         return dict(self.items())
 
     def get_proxy(self):
-        return MappingProxyType({
-            k: (self._views[k] if k in self._views else self._data[k].raw_data)
-            for k, v in self._data.items()
-        })
+        '''
+        Read-only mapping of the current views, or the raw data for keys without
+        a view. The mapping is cached and reflects later view changes.
+
+        .. versionchanged:: 0.6.0
+            The mapping is live instead of a snapshot of the views at the time
+            of the call.
+        '''
+        return self._proxy
 
     def _get_buffers(self, filter_allocated: bool = False):
-        for k, buf in self._data.items():
-            if not hasattr(buf, 'has_data') or (buf.has_data() and filter_allocated):
-                continue
-            yield k, buf
+        if not filter_allocated:
+            return self._buffer_items
+        allocated = self._allocated
+        return [(k, buf) for k, buf in self._buffer_items if not allocated[k]]
 
     def allocate_for_part(self, partition: Shape, roi: np.ndarray, lib=None):
         """
@@ -218,50 +261,88 @@ class UDFData:
             buf.set_shape_partition(partition, roi)
         for k, buf in self._get_buffers(filter_allocated=True):
             buf.allocate(lib=lib)
+            self._allocated[k] = True
+        self._update_current()
 
     def allocate_for_full(self, dataset, roi: np.ndarray):
         for k, buf in self._get_buffers():
             buf.set_shape_ds(dataset, roi)
         for k, buf in self._get_buffers(filter_allocated=True):
             buf.allocate()
+            self._allocated[k] = True
+        self._update_current()
 
     def set_view_for_dataset(self, dataset):
-        for k, buf in self._get_buffers():
-            self._views[k] = buf.get_view_for_dataset(dataset)
+        for k, buf in self._buffer_items:
+            self._current[k] = buf.get_view_for_dataset(dataset)
 
     def set_view_for_partition(self, partition: Shape):
-        for k, buf in self._get_buffers():
-            self._views[k] = buf.get_view_for_partition(partition)
+        for k, buf in self._buffer_items:
+            self._current[k] = buf.get_view_for_partition(partition)
 
     def set_view_for_tile(self, partition, tile):
-        for k, buf in self._get_buffers():
-            self._views[k] = buf.get_view_for_tile(partition, tile)
+        for k, buf in self._buffer_items:
+            self._current[k] = buf.get_view_for_tile(partition, tile)
 
     def set_contiguous_view_for_tile(self, partition, tile):
         # .. versionadded:: 0.5.0
-        for k, buf in self._get_buffers():
-            self._views[k] = buf.get_contiguous_view_for_tile(partition, tile)
+        for k, buf in self._buffer_items:
+            self._current[k] = buf.get_contiguous_view_for_tile(partition, tile)
 
     def flush(self, debug=False):
         # .. versionadded:: 0.5.0
-        for k, buf in self._get_buffers():
+        for k, buf in self._buffer_items:
             buf.flush(debug=debug)
 
     def export(self):
         # .. versionadded:: 0.6.0.dev0
-        for k, buf in self._get_buffers():
+        for k, buf in self._buffer_items:
             buf.export()
+        self._update_current()
 
     def set_view_for_frame(self, partition, tile, frame_idx):
-        for k, buf in self._get_buffers():
-            self._views[k] = buf.get_view_for_frame(partition, tile, frame_idx)
+        for k, buf in self._buffer_items:
+            self._current[k] = buf.get_view_for_frame(partition, tile, frame_idx)
+
+    def set_view_range_for_tile(self, partition, tile):
+        # .. versionadded:: 0.6.0
+        # Prepare the frame views of all frames in a tile, which
+        # are then activated with set_view_for_frame_in_range()
+        frame_views = []
+        for k, buf in self._buffer_items:
+            if buf.kind == 'nav':
+                frame_views.append((k, buf.get_frame_views_for_tile(partition, tile)))
+            else:
+                # the same view for all frames in the tile
+                self._current[k] = buf.get_view_for_frame(partition, tile, 0)
+        self._frame_views = tuple(frame_views)
+
+    def set_view_for_frame_in_range(self, frame_idx):
+        # .. versionadded:: 0.6.0
+        current = self._current
+        for k, views in self._frame_views:
+            current[k] = views[frame_idx]
 
     def new_for_partition(self, partition, roi: np.ndarray):
-        for k, buf in self._get_buffers():
-            self._data[k] = buf.new_for_partition(partition, roi)
+        # rebind buffers and views in a single pass; the set of keys and the
+        # allocation state are unchanged, as the new buffers are sliced from
+        # the existing data
+        data = self._data
+        current = self._current
+        buffer_items = []
+        for k, buf in self._buffer_items:
+            new_buf = buf.new_for_partition(partition, roi)
+            data[k] = new_buf
+            current[k] = new_buf.raw_data
+            buffer_items.append((k, new_buf))
+        self._buffer_items = tuple(buffer_items)
 
     def clear_views(self):
-        self._views = {}
+        # only buffers can have views; reset them in place to their raw data
+        self._frame_views = ()
+        current = self._current
+        for k, buf in self._buffer_items:
+            current[k] = buf.raw_data
 
 
 class UDFFrameMixin:
@@ -401,6 +482,22 @@ class UDFBase:
     '''
     Base class for UDFs with helper functions.
     '''
+    # processing method and optional hooks, resolved once per class
+    # in __init_subclass__ instead of probing each instance per task
+    _udf_method = None
+    _has_preprocess = False
+    _has_postprocess = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for method in ('tile', 'frame', 'partition'):
+            if hasattr(cls, 'process_' + method):
+                cls._udf_method = method
+                break
+        else:
+            cls._udf_method = None
+        cls._has_preprocess = hasattr(cls, 'preprocess')
+        cls._has_postprocess = hasattr(cls, 'postprocess')
 
     def allocate_for_part(self, partition, roi):
         for ns in [self.results]:
@@ -418,14 +515,17 @@ class UDFBase:
         for ns in [self.params, self.results]:
             ns.set_view_for_partition(partition)
 
+    # The per-tile and per-frame methods below address both namespaces directly
+    # instead of building a list of namespaces on each call
+
     def set_views_for_tile(self, partition, tile):
-        for ns in [self.params, self.results]:
-            ns.set_view_for_tile(partition, tile)
+        self.params.set_view_for_tile(partition, tile)
+        self.results.set_view_for_tile(partition, tile)
 
     def set_contiguous_views_for_tile(self, partition, tile):
         # .. versionadded:: 0.5.0
-        for ns in [self.params, self.results]:
-            ns.set_contiguous_view_for_tile(partition, tile)
+        self.params.set_contiguous_view_for_tile(partition, tile)
+        self.results.set_contiguous_view_for_tile(partition, tile)
 
     def flush(self, debug=False):
         # .. versionadded:: 0.5.0
@@ -433,8 +533,18 @@ class UDFBase:
             ns.flush(debug=debug)
 
     def set_views_for_frame(self, partition, tile, frame_idx):
-        for ns in [self.params, self.results]:
-            ns.set_view_for_frame(partition, tile, frame_idx)
+        self.params.set_view_for_frame(partition, tile, frame_idx)
+        self.results.set_view_for_frame(partition, tile, frame_idx)
+
+    def set_view_ranges_for_tile(self, partition, tile):
+        # .. versionadded:: 0.6.0
+        self.params.set_view_range_for_tile(partition, tile)
+        self.results.set_view_range_for_tile(partition, tile)
+
+    def set_views_for_frame_in_range(self, frame_idx):
+        # .. versionadded:: 0.6.0
+        self.params.set_view_for_frame_in_range(frame_idx)
+        self.results.set_view_for_frame_in_range(frame_idx)
 
     def clear_views(self):
         for ns in [self.params, self.results]:
@@ -459,6 +569,33 @@ class UDFBase:
     def set_backend(self, backend):
         assert backend in self.get_backends()
         self._backend = backend
+        self._xp = self._get_xp(backend)
+
+    @staticmethod
+    def _get_xp(backend):
+        if backend == 'numpy' or backend == 'cuda':
+            return np
+        elif backend == 'cupy':
+            # Importing only here to avoid superfluous import
+            import cupy
+            # mocking for testing without actual CUDA device
+            # import numpy as cupy
+            return cupy
+        else:
+            raise ValueError(f"Backend name can be 'numpy', 'cuda' or 'cupy', got {backend}")
+
+    def __getstate__(self):
+        # The back-end module is resolved once in set_backend() and
+        # can't be pickled, so it is resolved again after unpickling.
+        # tests/udf/test_simple_udf.py::test_udf_pickle
+        state = self.__dict__.copy()
+        state.pop('_xp', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if '_backend' in state:
+            self._xp = self._get_xp(self._backend)
 
     @property
     def xp(self):
@@ -469,28 +606,11 @@ class UDFBase:
 
         .. versionadded:: 0.6.0
         '''
-        # Implemented as property and not variable to avoid pickling issues
-        # tests/udf/test_simple_udf.py::test_udf_pickle
-        if self._backend == 'numpy' or self._backend == 'cuda':
-            return np
-        elif self._backend == 'cupy':
-            # Re-importing should be fast, right?
-            # Importing only here to avoid superfluous import
-            import cupy
-            # mocking for testing without actual CUDA device
-            # import numpy as cupy
-            return cupy
-        else:
-            raise ValueError(f"Backend name can be 'numpy', 'cuda' or 'cupy', got {self._backend}")
+        return self._xp
 
     def get_method(self):
-        if hasattr(self, 'process_tile'):
-            method = 'tile'
-        elif hasattr(self, 'process_frame'):
-            method = 'frame'
-        elif hasattr(self, 'process_partition'):
-            method = 'partition'
-        else:
+        method = self._udf_method
+        if method is None:
             raise TypeError("UDF should implement one of the `process_*` methods")
         return method
 
@@ -500,11 +620,11 @@ class UDF(UDFBase):
     The main user-defined functions interface. You can implement your functionality
     by overriding methods on this class.
     """
-    USE_NATIVE_DTYPE = np.bool
+    USE_NATIVE_DTYPE = bool
     TILE_SIZE_BEST_FIT = object()
-    TILE_SIZE_MAX = np.float("inf")
+    TILE_SIZE_MAX = float("inf")
     TILE_DEPTH_DEFAULT = object()
-    TILE_DEPTH_MAX = np.float("inf")
+    TILE_DEPTH_MAX = float("inf")
 
     def __init__(self, **kwargs):
         """
@@ -537,11 +657,13 @@ class UDF(UDFBase):
             to the current unit of data (frame, tile, partition).
         """
         self._backend = 'numpy'  # default so that self.xp can always be used
+        self._xp = np
         self._kwargs = kwargs
         self.params = UDFData(kwargs)
         self.task_data = None
         self.results = None
         self._requires_custom_merge = None
+        self._result_buffer_keys = None
 
     def copy(self):
         return self.__class__(**self._kwargs)
@@ -620,6 +742,17 @@ class UDF(UDFBase):
             self._requires_custom_merge = any(buffer.kind != 'nav' for buffer in buffers.values())
         return self._requires_custom_merge
 
+    def _prepare_merge(self):
+        """
+        Cache the result buffer names and :attr:`requires_custom_merge` from
+        the already initialized result buffers, so that merging doesn't have
+        to call :meth:`get_result_buffers` again or re-discover the keys
+        for each partition.
+        """
+        buffers = self.results.as_dict()
+        self._result_buffer_keys = tuple(buffers.keys())
+        self._requires_custom_merge = any(buffer.kind != 'nav' for buffer in buffers.values())
+
     def merge(self, dest: Dict[str, np.array], src: Dict[str, np.array]):
         """
         Merge a partial result `src` into the current global result `dest`.
@@ -643,15 +776,30 @@ class UDF(UDFBase):
         ----
         This function is running on the leader node, which means `self.results`
         and `self.task_data` are not available.
+
+        :meth:`UDFRunner.run_for_dataset` calls this function on a background
+        thread, so that merging overlaps with receiving the next partial result.
+        Merges still run one at a time and in order. An exception raised here
+        is re-raised in the calling thread when the next partial result has
+        arrived, or after the last partition.
+
+        .. versionchanged:: 0.6.0
+            Merging runs on a background thread.
         """
         if self.requires_custom_merge:
             raise NotImplementedError(
                 "Default merging only works for kind='nav' buffers. "
                 "Please implement a suitable custom merge function."
             )
-        for k in dest:
-            check_cast(dest[k], src[k])
-            dest[k][:] = src[k]
+        keys = self._result_buffer_keys
+        if keys is None:
+            keys = dest.keys()
+        for k in keys:
+            dest_buf, src_buf = dest[k], src[k]
+            check_cast(dest_buf, src_buf)
+            # NumPy already coalesces contiguous dimensions into a flat
+            # copy loop; slice assignment has the least call overhead
+            dest_buf[:] = src_buf
 
     def get_preferred_input_dtype(self):
         '''
@@ -676,7 +824,7 @@ class UDF(UDFBase):
         If you prefer to always use the dataset's native dtype instead of
         floats, you can override this method to return
         :attr:`UDF.USE_NATIVE_DTYPE`, which is currently identical to
-        :code:`numpy.bool` and behaves as a neutral element in
+        :code:`bool` and behaves as a neutral element in
         :func:`numpy.result_type`.
 
         .. versionadded:: 0.4.0
@@ -770,6 +918,9 @@ class UDF(UDFBase):
 
 
 def check_cast(fromvar, tovar):
+    # Identical dtypes are the common case when merging
+    if fromvar.dtype == tovar.dtype:
+        return
     if not np.can_cast(fromvar.dtype, tovar.dtype, casting='safe'):
         # FIXME exception or warning?
         raise TypeError("Unsafe automatic casting from %s to %s" % (fromvar.dtype, tovar.dtype))
@@ -875,20 +1026,21 @@ class UDFTask(Task):
         needs_cuda = 0
         needs_cpu = 0
         needs_ndarray = 0
+        # Limit to externally specified backends
+        limit = self._backends
+        if isinstance(limit, str):
+            limit = (limit, )
+        if limit is not None:
+            limit = frozenset(limit)
         backends_for_udfs = []
         for udf in self._udfs:
             b = udf.get_backends()
             if isinstance(b, str):
                 b = (b, )
-            backends_for_udfs.append(set(b))
-
-        # Limit to externally specified backends
-        for backend_set in backends_for_udfs:
-            if self._backends is not None:
-                b = self._backends
-                if isinstance(b, str):
-                    b = (b, )
-                backends = set(b).intersection(backend_set)
+            backend_set = set(b)
+            backends_for_udfs.append(backend_set)
+            if limit is not None:
+                backends = limit.intersection(backend_set)
             else:
                 backends = backend_set
             needs_cuda += 'numpy' not in backends
@@ -909,6 +1061,106 @@ class UDFTask(Task):
         return result
 
 
+# One stream per device id, shared by the partitions processed on it. CuPy's
+# memory pool keeps free lists per stream, so a new stream for every partition
+# would not reuse the device memory freed by the previous one.
+_device_streams: Dict[int, Any] = {}
+# Whether a device id shares the physical memory with the host, which doesn't
+# change while the process runs
+_device_integrated: Dict[int, bool] = {}
+
+
+class _DeviceTileUploader:
+    """
+    Copy tiles to the device through reusable page-locked staging buffers.
+
+    Pageable host memory can't be copied asynchronously, and CuPy stages it
+    through a temporary page-locked buffer for each copy. Instead, the tile is
+    copied into one of our own staging buffers, and both the upload and the
+    processing by the CuPy UDFs are issued to :attr:`stream`. The host can then
+    read the next tile while the device is still busy with the current one.
+
+    Two staging buffers are used in turn, so that staging the next tile only
+    has to wait for the upload before the current one. A staging buffer is
+    only overwritten once the previous copy from it has completed.
+
+    On integrated GPUs, which share the physical memory with the host, the
+    device works on the staging buffer directly instead of a copy. In that
+    case a staging buffer is only reused after the tile in it was processed.
+    """
+    SLOTS = 2
+
+    def __init__(self, cupy):
+        self._cupy = cupy
+        # A blocking stream still synchronizes with the legacy default stream,
+        # which is used for allocating and post-processing the result buffers.
+        # All work stays on this one stream, as the UDFs accumulate into the
+        # same result buffers for consecutive tiles.
+        self._device_id = device_id = cupy.cuda.Device().id
+        if device_id not in _device_streams:
+            _device_streams[device_id] = cupy.cuda.Stream()
+        self.stream = _device_streams[device_id]
+        if device_id not in _device_integrated:
+            props = cupy.cuda.runtime.getDeviceProperties(device_id)
+            _device_integrated[device_id] = bool(props.get('integrated', False))
+        self._zero_copy = _device_integrated[device_id]
+        self._staging = [None] * self.SLOTS
+        # events after which the staging buffer of a slot can be reused
+        self._released = [None] * self.SLOTS
+        self._slot = 0
+
+    def _get_staging(self, slot, tile):
+        nbytes = tile.nbytes
+        staging = self._staging[slot]
+        if staging is None or staging.nbytes < nbytes:
+            mem = self._cupy.cuda.alloc_pinned_memory(nbytes)
+            staging = np.frombuffer(mem, dtype=np.uint8, count=nbytes)
+            self._staging[slot] = staging
+        return staging[:nbytes].view(tile.dtype).reshape(tile.shape)
+
+    def _map(self, staging):
+        # With unified addressing, page-locked host memory is accessible from
+        # the device under the same address
+        cuda = self._cupy.cuda
+        mem = cuda.UnownedMemory(
+            staging.ctypes.data, staging.nbytes, staging, self._device_id
+        )
+        return self._cupy.ndarray(
+            staging.shape, dtype=staging.dtype, memptr=cuda.MemoryPointer(mem, 0)
+        )
+
+    def upload(self, tile):
+        """
+        Start copying :code:`tile` to the device, to be called while
+        :attr:`stream` is the current stream. Call :meth:`release` once all
+        work on the returned device tile is queued.
+        """
+        slot = self._slot
+        if self._released[slot] is not None:
+            self._released[slot].synchronize()
+        staging = self._get_staging(slot, tile)
+        np.copyto(staging, tile)
+        if self._zero_copy:
+            return self._map(staging)
+        device_tile = self._cupy.empty(tile.shape, dtype=tile.dtype)
+        device_tile.set(staging, stream=self.stream)
+        self._released[slot] = self.stream.record()
+        return device_tile
+
+    def release(self):
+        """
+        Mark the staging buffer of the last :meth:`upload` as reusable once the
+        work queued on :attr:`stream` so far is done.
+        """
+        slot = self._slot
+        if self._zero_copy:
+            self._released[slot] = self.stream.record()
+        self._slot = (slot + 1) % self.SLOTS
+
+    def synchronize(self):
+        self.stream.synchronize()
+
+
 class UDFRunner:
     def __init__(self, udfs, debug=False):
         self._udfs = udfs
@@ -953,7 +1205,7 @@ class UDFRunner:
             udf.init_result_buffers()
             udf.allocate_for_part(partition, roi)
             udf.init_task_data()
-            if hasattr(udf, 'preprocess'):
+            if udf._has_preprocess:
                 udf.clear_views()
                 udf.preprocess()
         neg = Negotiator()
@@ -967,43 +1219,53 @@ class UDFRunner:
             corrections=corrections,
         )
 
-        # FIXME: don't fully re-create?
-        meta = UDFMeta(
-            partition_shape=partition.slice.adjust_for_roi(roi).shape,
-            dataset_shape=partition.meta.shape,
-            roi=roi,
-            dataset_dtype=partition.dtype,
-            input_dtype=dtype,
-            tiling_scheme=tiling_scheme,
-            corrections=corrections,
-            device_class=device_class,
-        )
-        for udf in udfs:
-            udf.set_meta(meta)
+        # all UDFs share this meta object
+        meta.tiling_scheme = tiling_scheme
         return (meta, tiling_scheme, dtype)
 
-    def _run_tile(self, udfs, partition, tile, device_tile):
-        for udf in udfs:
-            method = udf.get_method()
-            if method == 'tile':
-                udf.set_contiguous_views_for_tile(partition, tile)
-                udf.set_slice(tile.tile_slice)
-                udf.process_tile(device_tile)
-            elif method == 'frame':
-                tile_slice = tile.tile_slice
-                for frame_idx, frame in enumerate(device_tile):
-                    frame_slice = Slice(
-                        origin=(tile_slice.origin[0] + frame_idx,) + tile_slice.origin[1:],
-                        shape=Shape((1,) + tuple(tile_slice.shape)[1:],
-                                    sig_dims=tile_slice.shape.sig.dims),
-                    )
-                    udf.set_slice(frame_slice)
-                    udf.set_views_for_frame(partition, tile, frame_idx)
-                    udf.process_frame(frame)
-            elif method == 'partition':
-                udf.set_views_for_tile(partition, tile)
-                udf.set_slice(partition.slice)
-                udf.process_partition(device_tile)
+    def _process_tile(self, udf, partition, tile, device_tile):
+        udf.set_contiguous_views_for_tile(partition, tile)
+        udf.set_slice(tile.tile_slice)
+        udf.process_tile(device_tile)
+
+    def _process_frames(self, udf, partition, tile, device_tile):
+        tile_slice = tile.tile_slice
+        udf.set_view_ranges_for_tile(partition, tile)
+        # the frame slices of a tile only differ in the nav origin
+        nav_origin = tile_slice.origin[0]
+        sig_origin = tile_slice.origin[1:]
+        frame_shape = Shape((1,) + tuple(tile_slice.shape)[1:],
+                            sig_dims=tile_slice.shape.sig.dims)
+        for frame_idx, frame in enumerate(device_tile):
+            frame_slice = Slice(
+                origin=(nav_origin + frame_idx,) + sig_origin,
+                shape=frame_shape,
+            )
+            udf.set_slice(frame_slice)
+            udf.set_views_for_frame_in_range(frame_idx)
+            udf.process_frame(frame)
+
+    def _process_partition(self, udf, partition, tile, device_tile):
+        udf.set_views_for_tile(partition, tile)
+        udf.set_slice(partition.slice)
+        udf.process_partition(device_tile)
+
+    def _get_tile_processors(self, udfs):
+        # resolve the processing method of each UDF once per partition,
+        # not for each tile
+        processors = {
+            'tile': self._process_tile,
+            'frame': self._process_frames,
+            'partition': self._process_partition,
+        }
+        return [
+            (udf, processors[udf.get_method()])
+            for udf in udfs
+        ]
+
+    def _run_tile(self, udf_processors, partition, tile, device_tile):
+        for udf, process in udf_processors:
+            process(udf, partition, tile, device_tile)
 
     def _run_udfs(self, numpy_udfs, cupy_udfs, partition, tiling_scheme, roi, dtype):
         # FIXME pass information on target location (numpy or cupy)
@@ -1014,21 +1276,37 @@ class UDFRunner:
             roi=roi, dest_dtype=dtype,
         )
 
+        numpy_processors = self._get_tile_processors(numpy_udfs)
+        cupy_processors = self._get_tile_processors(cupy_udfs)
+        uploader = None
         if cupy_udfs:
             xp = cupy_udfs[0].xp
+            # NumPy can stand in for CuPy, for example in tests
+            if xp is not np:
+                uploader = _DeviceTileUploader(xp)
 
         for tile in tiles:
-            self._run_tile(numpy_udfs, partition, tile, tile)
-            if cupy_udfs:
+            if uploader is not None:
                 # Work-around, should come from dataset later
+                # Queue the device work first, so that the NumPy UDFs
+                # below run on the host while the device is busy
+                with uploader.stream:
+                    device_tile = uploader.upload(tile)
+                    self._run_tile(cupy_processors, partition, tile, device_tile)
+                    uploader.release()
+            self._run_tile(numpy_processors, partition, tile, tile)
+            if uploader is None and cupy_udfs:
                 device_tile = xp.asanyarray(tile)
-                self._run_tile(cupy_udfs, partition, tile, device_tile)
+                self._run_tile(cupy_processors, partition, tile, device_tile)
+        if uploader is not None:
+            # results are accessed from the host after this point
+            uploader.synchronize()
 
     def _wrapup_udfs(self, numpy_udfs, cupy_udfs, partition):
         udfs = numpy_udfs + cupy_udfs
         for udf in udfs:
             udf.flush(self._debug)
-            if hasattr(udf, 'postprocess'):
+            if udf._has_postprocess:
                 udf.clear_views()
                 udf.postprocess()
 
@@ -1083,8 +1361,12 @@ class UDFRunner:
                     # Avoid importing if not used
                     import cupy
                     device = get_use_cuda()
-                    previous_id = cupy.cuda.Device().id
-                    cupy.cuda.Device(device).use()
+                    current_id = cupy.cuda.Device().id
+                    # Workers usually stay on their device, only switch and
+                    # restore if necessary
+                    if current_id != device:
+                        previous_id = current_id
+                        cupy.cuda.Device(device).use()
                 (meta, tiling_scheme, dtype) = self._init_udfs(
                     numpy_udfs, cupy_udfs, partition, roi, corrections, device_class
                 )
@@ -1103,7 +1385,7 @@ class UDFRunner:
             cloudpickle.loads(cloudpickle.dumps(tasks))
 
     def _check_preconditions(self, dataset: DataSet, roi):
-        if roi is not None and np.product(roi.shape) != np.product(dataset.shape.nav):
+        if roi is not None and roi.size != dataset.shape.nav.size:
             raise ValueError(
                 "roi: incompatible shapes: %s (roi) vs %s (dataset)" % (
                     roi.shape, dataset.shape.nav
@@ -1124,14 +1406,23 @@ class UDFRunner:
             udf.set_meta(meta)
             udf.init_result_buffers()
             udf.allocate_for_full(dataset, roi)
+            udf._prepare_merge()
 
-            if hasattr(udf, 'preprocess'):
+            if udf._has_preprocess:
                 udf.set_views_for_dataset(dataset)
                 udf.preprocess()
 
         tasks = list(self._make_udf_tasks(dataset, roi, corrections, backends))
         return tasks
 
+    def _merge_results(self, part_results, partition):
+        for results, udf in zip(part_results, self._udfs):
+            udf.set_views_for_partition(partition)
+            udf.merge(
+                dest=udf.results.get_proxy(),
+                src=results.get_proxy()
+            )
+
     def run_for_dataset(self, dataset: DataSet, executor,
                         roi=None, progress=False, corrections=None, backends=None):
         tasks = self._prepare_run_for_dataset(dataset, executor, roi, corrections, backends)
@@ -1140,15 +1431,20 @@ class UDFRunner:
 
         if progress:
             t = tqdm.tqdm(total=len(tasks))
-        for part_results, task in executor.run_tasks(tasks, cancel_id):
-            if progress:
-                t.update(1)
-            for results, udf in zip(part_results, self._udfs):
-                udf.set_views_for_partition(task.partition)
-                udf.merge(
-                    dest=udf.results.get_proxy(),
-                    src=results.get_proxy()
-                )
+        # Merge in a background thread, so that merging the results of one
+        # partition overlaps with waiting for, or computing, the next one.
+        # A single worker keeps the merges in order, and waiting for the
+        # previous merge bounds the number of results held in memory.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as merger:
+            pending = None
+            for part_results, task in executor.run_tasks(tasks, cancel_id):
+                if progress:
+                    t.update(1)
+                if pending is not None:
+                    pending.result()
+                pending = merger.submit(self._merge_results, part_results, task.partition)
+            if pending is not None:
+                pending.result()
 
         if progress:
             t.close()
@@ -1165,12 +1461,8 @@ class UDFRunner:
         tasks = self._prepare_run_for_dataset(dataset, executor, roi, corrections, backends)
 
         async for part_results, task in executor.run_tasks(tasks, cancel_id):
-            for results, udf in zip(part_results, self._udfs):
-                udf.set_views_for_partition(task.partition)
-                udf.merge(
-                    dest=udf.results.get_proxy(),
-                    src=results.get_proxy()
-                )
+            self._merge_results(part_results, task.partition)
+            for udf in self._udfs:
                 udf.clear_views()
             yield tuple(
                 udf.results.as_dict()
@@ -1185,14 +1477,17 @@ class UDFRunner:
                 for udf in self._udfs
             )
 
-    def _roi_for_partition(self, roi, partition: Partition):
-        return roi.reshape(-1)[partition.slice.get(nav_only=True)]
-
     def _make_udf_tasks(self, dataset: DataSet, roi, corrections, backends):
+        if roi is not None:
+            # roi_counts[i] is the number of selected frames before frame i,
+            # so that each partition can be checked for an empty roi in O(1)
+            roi_counts = np.zeros(roi.size + 1, dtype=np.int64)
+            np.cumsum(roi.reshape(-1) != 0, dtype=np.int64, out=roi_counts[1:])
         for idx, partition in enumerate(dataset.get_partitions()):
             if roi is not None:
-                roi_for_part = self._roi_for_partition(roi, partition)
-                if np.count_nonzero(roi_for_part) == 0:
+                start = partition.slice.origin[0]
+                stop = start + partition.slice.shape[0]
+                if roi_counts[stop] == roi_counts[start]:
                     # roi is empty for this partition, ignore
                     continue
             udfs = [
@@ -4,6 +4,7 @@ import numpy as np
 from libertem.io.dataset.memory import MemoryDataSet
 from libertem.common.buffers import BufferWrapper, AuxBufferWrapper, reshaped_view
 from libertem.common import Shape
+from libertem.io.dataset.base import TilingScheme
 
 from utils import _mk_random
 
@@ -44,6 +45,34 @@ def test_new_for_partition():
             auxdata.reshape(-1)[ps][roi_part]
         )
 
+
+@pytest.mark.parametrize(
+    'extra_shape', [(), (2,)]
+)
+def test_frame_views_for_tile(extra_shape):
+    dataset = MemoryDataSet(data=_mk_random(size=(16, 16, 16, 16), dtype="float32"),
+                            num_partitions=2, sig_dims=2)
+    roi = _mk_random(size=dataset.shape.nav, dtype="bool")
+    tiling_scheme = TilingScheme.make_for_shape(
+        tileshape=Shape((7, 16, 16), sig_dims=2),
+        dataset_shape=dataset.shape,
+    )
+
+    for partition in dataset.get_partitions():
+        buf = BufferWrapper(kind="nav", extra_shape=extra_shape)
+        buf.set_shape_partition(partition, roi)
+        buf.allocate()
+        buf.raw_data[:] = np.arange(buf.raw_data.size).reshape(buf.raw_data.shape)
+        for tile in partition.get_tiles(tiling_scheme=tiling_scheme, roi=roi):
+            frame_views = buf.get_frame_views_for_tile(partition, tile)
+            assert len(frame_views) == tile.shape[0]
+            for frame_idx in range(tile.shape[0]):
+                view = buf.get_view_for_frame(partition, tile, frame_idx)
+                assert frame_views[frame_idx].shape == view.shape
+                assert np.shares_memory(frame_views[frame_idx], view)
+                assert np.all(frame_views[frame_idx] == view)
+
+
 def test_buffer_extra_shape_1():
     buffer = BufferWrapper(kind = 'nav', extra_shape = (2, 3))
     assert buffer._extra_shape == (2, 3)
@@ -1,11 +1,14 @@
 import os
 import sys
+import types
 from unittest import mock
 
 import pytest
 import numpy as np
 
 import libertem.common.backend as bae
+import libertem.udf.base as base
+from libertem.udf import UDF
 
 from utils import _mk_random, DebugDeviceUDF
 
@@ -155,3 +158,192 @@ def test_run_numpy(lt_ctx, mask_cupy):
 
     assert np.all(res['device_class'].data == 'cpu')
     assert np.allclose(res['on_device'].data, data.sum(axis=(0, 1)))
+
+
+class FakeCupy(types.ModuleType):
+    """
+    Stand-in for :code:`cupy` that runs on NumPy and records the stream
+    operations of :class:`libertem.udf.base._DeviceTileUploader` in :attr:`log`
+    """
+    def __init__(self, device_id=0, integrated=False):
+        super().__init__('cupy')
+        self.log = []
+        log = self.log
+        events = []
+
+        class Event:
+            def __init__(self):
+                self.idx = len(events)
+                events.append(self)
+
+            def synchronize(self):
+                log.append(('wait', self.idx))
+
+        class Stream:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                pass
+
+            def record(self):
+                event = Event()
+                log.append(('record', event.idx))
+                return event
+
+            def synchronize(self):
+                log.append(('synchronize',))
+
+        class Device:
+            def __init__(self, id=None):
+                self.id = device_id
+
+            def use(self):
+                pass
+
+        class ndarray(np.ndarray):
+            def __new__(cls, shape, dtype=float, memptr=None):
+                buffer = None if memptr is None else memptr.mem.owner
+                return np.ndarray.__new__(cls, shape, dtype, buffer=buffer)
+
+            def set(self, arr, stream=None):
+                log.append(('copy',))
+                self[...] = arr
+
+        class UnownedMemory:
+            def __init__(self, ptr, size, owner, device_id):
+                self.owner = owner
+
+        class MemoryPointer:
+            def __init__(self, mem, offset):
+                self.mem = mem
+
+        self.ndarray = ndarray
+        self.cuda = types.SimpleNamespace(
+            Stream=Stream,
+            Event=Event,
+            Device=Device,
+            UnownedMemory=UnownedMemory,
+            MemoryPointer=MemoryPointer,
+            alloc_pinned_memory=bytearray,
+            runtime=types.SimpleNamespace(
+                getDeviceProperties=lambda id: {'integrated': int(integrated)}
+            ),
+        )
+
+    def empty(self, shape, dtype=float):
+        return self.ndarray(shape, dtype=dtype)
+
+    def __getattr__(self, name):
+        return getattr(np, name)
+
+
+class TileSumUDF(UDF):
+    def get_result_buffers(self):
+        return {
+            'sum': self.buffer(kind="sig", dtype=np.float32),
+        }
+
+    def process_tile(self, tile):
+        self.results.sum[:] += self.xp.sum(tile, axis=0)
+
+    def merge(self, dest, src):
+        dest['sum'][:] += src['sum']
+
+    def get_backends(self):
+        return ('cupy',)
+
+
+@pytest.fixture
+def fake_cupy(monkeypatch):
+    monkeypatch.setattr(base, '_device_streams', {})
+    monkeypatch.setattr(base, '_device_integrated', {})
+    cupy = FakeCupy()
+    monkeypatch.setitem(sys.modules, 'cupy', cupy)
+    return cupy
+
+
+def test_upload_staging_slots(fake_cupy):
+    uploader = base._DeviceTileUploader(fake_cupy)
+    tiles = [np.full((2, 3), i, dtype=np.float32) for i in range(3)]
+    staging = []
+    for tile in tiles:
+        with uploader.stream:
+            device_tile = uploader.upload(tile)
+            staging.append(uploader._staging[uploader._slot])
+            uploader.release()
+        assert np.all(device_tile == tile)
+        assert not np.may_share_memory(device_tile, staging[-1])
+    uploader.synchronize()
+
+    assert staging[0] is staging[2]
+    assert staging[0] is not staging[1]
+    assert fake_cupy.log == [
+        ('copy',), ('record', 0),
+        ('copy',), ('record', 1),
+        # the first staging buffer is only reused after its copy is done
+        ('wait', 0), ('copy',), ('record', 2),
+        ('synchronize',),
+    ]
+
+
+def test_upload_stream_per_device(fake_cupy):
+    stream = base._DeviceTileUploader(fake_cupy).stream
+    assert base._DeviceTileUploader(fake_cupy).stream is stream
+    assert base._DeviceTileUploader(FakeCupy(device_id=1)).stream is not stream
+
+
+def test_upload_zero_copy(fake_cupy):
+    # the fixture only resets the per-device state here
+    cupy = FakeCupy(device_id=1, integrated=True)
+    uploader = base._DeviceTileUploader(cupy)
+    assert uploader._zero_copy
+    tiles = [np.full((2, 3), i, dtype=np.float32) for i in range(3)]
+    for tile in tiles:
+        with uploader.stream:
+            device_tile = uploader.upload(tile)
+            assert np.all(device_tile == tile)
+            # the device works on the staging buffer directly
+            assert np.may_share_memory(device_tile, uploader._staging[uploader._slot])
+            uploader.release()
+    uploader.synchronize()
+
+    assert cupy.log == [
+        ('record', 0),
+        ('record', 1),
+        # the first staging buffer is only reused after its tile was processed
+        ('wait', 0), ('record', 2),
+        ('synchronize',),
+    ]
+
+
+def test_integrated_per_device(fake_cupy):
+    queried = []
+
+    def get_device_properties(id):
+        queried.append(id)
+        return {'integrated': 1}
+
+    fake_cupy.cuda.runtime.getDeviceProperties = get_device_properties
+    assert base._DeviceTileUploader(fake_cupy)._zero_copy
+    assert base._DeviceTileUploader(fake_cupy)._zero_copy
+    assert queried == [0]
+    assert not base._DeviceTileUploader(FakeCupy(device_id=1))._zero_copy
+
+
+def test_run_fake_cupy(lt_ctx, fake_cupy):
+    data = _mk_random(size=(16, 16, 16), dtype=np.float32)
+    ds = lt_ctx.load(
+        "memory", data=data, tileshape=(4, 16, 16), num_partitions=2, sig_dims=2
+    )
+
+    with mock.patch.dict(os.environ, {'LIBERTEM_USE_CUDA': "0"}):
+        bae.set_use_cuda(0)
+        res = lt_ctx.run_udf(udf=TileSumUDF(), dataset=ds)
+
+    assert np.allclose(res['sum'].data, data.sum(axis=0))
+    copies = fake_cupy.log.count(('copy',))
+    assert copies == 4
+    # each partition waits for its work on the device before its results are used
+    assert fake_cupy.log.count(('synchronize',)) == 2
+    assert fake_cupy.log[-1] == ('synchronize',)
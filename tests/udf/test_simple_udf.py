@@ -4,7 +4,7 @@ import numpy as np
 import pytest
 
 from libertem.udf.base import UDF, UDFRunner
-from libertem.udf.base import UDFMeta
+from libertem.udf.base import UDFMeta, UDFData
 from libertem.io.dataset.memory import MemoryDataSet
 from libertem.utils.devices import detect
 from libertem.common.backend import set_use_cpu, set_use_cuda
@@ -138,6 +138,36 @@ def test_bad_merge(lt_ctx):
         lt_ctx.run_udf(dataset=dataset, udf=bm)
 
 
+@pytest.mark.parametrize('num_partitions', [1, 4])
+def test_merge_raises(lt_ctx, num_partitions):
+    """
+    Exceptions from merge, which runs on a background thread, reach the caller
+    """
+    data = _mk_random(size=(16 * 16, 16, 16), dtype="float32")
+    dataset = MemoryDataSet(data=data, tileshape=(1, 16, 16),
+                            num_partitions=num_partitions, sig_dims=2)
+
+    class MergeError(Exception):
+        pass
+
+    class RaisingmergeUDF(UDF):
+        def get_result_buffers(self):
+            return {
+                'pixelsum': self.buffer(
+                    kind="nav", dtype="float32"
+                )
+            }
+
+        def process_frame(self, frame):
+            self.results.pixelsum[:] = np.sum(frame)
+
+        def merge(self, dest, src):
+            raise MergeError()
+
+    with pytest.raises(MergeError):
+        lt_ctx.run_udf(dataset=dataset, udf=RaisingmergeUDF())
+
+
 def test_no_default_merge(lt_ctx):
     """
     Test forgotten merge function if not :code:`kind='nav'`.
@@ -510,3 +540,35 @@ def test_noncontiguous_tiles(lt_ctx, backend):
         set_use_cpu(0)
 
     assert np.all(res["sigbuf"].data == 1)
+
+
+def test_udf_data_proxy_is_live():
+    data = _mk_random(size=(16, 8, 8), dtype="float32")
+    dataset = MemoryDataSet(data=data, tileshape=(4, 8, 8), num_partitions=2, sig_dims=2)
+    udf = PixelsumUDF()
+    udf.init_result_buffers()
+    udf.allocate_for_full(dataset, roi=None)
+
+    proxy = udf.results.get_proxy()
+    assert udf.results.get_proxy() is proxy
+    assert proxy['pixelsum'].shape == (16, )
+
+    partition = list(dataset.get_partitions())[1]
+    udf.set_views_for_partition(partition)
+    # the proxy obtained earlier now yields the view for the partition
+    assert proxy['pixelsum'].shape == (8, )
+    proxy['pixelsum'][:] = 1
+    assert np.all(udf.results['pixelsum'].data[8:] == 1)
+    assert np.all(udf.results['pixelsum'].data[:8] == 0)
+
+    udf.clear_views()
+    assert proxy['pixelsum'].shape == (16, )
+
+    with pytest.raises(TypeError):
+        proxy['pixelsum'] = np.zeros(16)
+
+
+def test_udf_data_uninitialized():
+    data = UDFData.__new__(UDFData)
+    assert not hasattr(data, 'foo')
+    assert not hasattr(data, '_current')
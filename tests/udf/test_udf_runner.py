@@ -170,3 +170,33 @@ def test_common_backends_string(default_raw, lt_ctx):
     ))
     for task in tasks:
         assert task.get_resources() == {'CUDA': 1, 'compute': 1}
+
+
+@pytest.mark.parametrize('roi_dtype', [bool, np.float32, np.int64])
+def test_make_udf_tasks_skips_empty_roi(roi_dtype):
+    data = _mk_random(size=(16, 16, 16), dtype="float32")
+    dataset = MemoryDataSet(data=data, tileshape=(1, 16, 16),
+                            num_partitions=4, sig_dims=2)
+    roi = np.zeros(16, dtype=roi_dtype)
+    # partition 0: single non-integer value
+    roi[1] = 0.5 if roi_dtype is np.float32 else 1
+    # partition 1 stays empty
+    # partition 2: values that cancel out when summed
+    if roi_dtype is np.int64:
+        roi[8] = 1
+        roi[9] = -1
+    else:
+        roi[8] = 1
+    # partition 3: all selected
+    roi[12:] = 1
+
+    expected = [
+        p.slice for p in dataset.get_partitions()
+        if np.count_nonzero(roi[p.slice.get(nav_only=True)]) > 0
+    ]
+    runner = UDFRunner([PixelsumUDF()])
+    tasks = list(runner._make_udf_tasks(
+        dataset=dataset, roi=roi, corrections=None, backends=None
+    ))
+    assert [task.partition.slice for task in tasks] == expected
+    assert len(tasks) == 3
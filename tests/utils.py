@@ -27,14 +27,10 @@ def _naive_mask_apply(masks, data):
         assert mask.shape == data.shape[2:], "mask doesn't fit frame size"
 
     dtype = np.result_type(*[m.dtype for m in masks], data.dtype)
-    res = np.zeros((len(masks),) + tuple(data.shape[:2]), dtype=dtype)
-    for n in range(len(masks)):
-        mask = to_dense(masks[n])
-        for i in range(data.shape[0]):
-            for j in range(data.shape[1]):
-                item = data[i, j].ravel().dot(mask.ravel())
-                res[n, i, j] = item
-    return res
+    masks_2d = np.stack([to_dense(mask).ravel() for mask in masks]).astype(dtype, copy=False)
+    data_2d = data.reshape((data.shape[0] * data.shape[1], -1)).astype(dtype, copy=False)
+    res = masks_2d @ data_2d.T
+    return res.reshape((len(masks),) + tuple(data.shape[:2]))
 
 
 # This function introduces asymmetries so that errors won't average out so
@@ -45,7 +41,13 @@ def _mk_random(size, dtype='float32'):
         choice = [0, 1, -1, 0+1j, 0-1j]
     else:
         choice = [0, 1]
-    data = np.random.choice(choice, size=size).astype(dtype)
+    # draw indices as small integers and look up the values, which avoids
+    # the int64 / complex128 intermediates of np.random.choice
+    idx = np.random.randint(0, len(choice), size=size, dtype=np.uint8)
+    if dtype.kind == 'c':
+        data = np.array(choice, dtype=dtype)[idx]
+    else:
+        data = idx.astype(dtype)
     coords2 = tuple((np.random.choice(range(c)) for c in size))
     coords10 = tuple((np.random.choice(range(c)) for c in size))
     data[coords2] = np.random.choice(choice) * sum(size)
@@ -80,7 +82,8 @@ class PixelsumUDF(UDF):
     def process_frame(self, frame):
         assert frame.shape == (16, 16)
         assert self.results.pixelsum.shape == (1,)
-        self.results.pixelsum[:] = np.sum(frame)
+        # reduce directly into the 0-d view of the result, without a temporary
+        np.add.reduce(frame, axis=None, out=self.results.pixelsum[0, ...])
 
 
 class MockFile: